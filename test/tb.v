@@ -18,10 +18,59 @@ module tb ();
   wire [7:0] uio_out;
   wire [7:0] uio_oe;
 
+  // 30 ns (~33 MHz) clock, generated in HDL so no Python callback runs per edge
+  initial clk = 1'b0;
+  always #15 clk = ~clk;
+
+  // Block feeder: cocotb loads a whole 136-byte block into feed_data and
+  // sets feed_count, then the testbench presents one byte per clock on
+  // ui_in/uio_in without a Python round-trip per byte.
+  reg [1087:0] feed_data;
+  reg [7:0]    feed_uio;
+  reg [7:0]    feed_count;
+
+  initial feed_count = 8'd0;
+
+  // Digest drain: cocotb sets drain_count to the number of digest bytes
+  // wanted, then the testbench reads them with the documented handshake:
+  // capture uo_out while pulsing result_next for one clock, then drop
+  // result_next for one clock (drain_gap) before the next byte. The bytes
+  // collect in the top of drain_data (first byte lowest) and are read back
+  // in one access.
+  localparam [7:0] RESULT_NEXT = 8'h08;  // uio_in[3]
+
+  reg [255:0] drain_data;
+  reg [5:0]   drain_count;
+  reg         drain_gap;
+
+  initial drain_count = 6'd0;
+  initial drain_gap = 1'b0;
+
+  wire       feeding    = (feed_count != 8'd0);
+  wire       capturing  = (drain_count != 6'd0) && !drain_gap;
+  // No result_next with the last capture, so the FSM stays in SQUEEZE
+  wire       drain_next = capturing && (drain_count > 6'd1);
+  wire [7:0] dut_ui_in  = feeding ? feed_data[7:0] : ui_in;
+  wire [7:0] dut_uio_in = feeding ? feed_uio : drain_next ? RESULT_NEXT : uio_in;
+
+  always @(posedge clk) begin
+    if (feeding) begin
+      feed_data  <= feed_data >> 8;
+      feed_count <= feed_count - 8'd1;
+    end
+    if (capturing) begin
+      drain_data  <= {uo_out, drain_data[255:8]};
+      drain_count <= drain_count - 6'd1;
+      drain_gap   <= (drain_count > 6'd1);
+    end else begin
+      drain_gap   <= 1'b0;
+    end
+  end
+
   tt_um_emersonmde_vilya user_project (
-      .ui_in  (ui_in),
+      .ui_in  (dut_ui_in),
       .uo_out (uo_out),
-      .uio_in (uio_in),
+      .uio_in (dut_uio_in),
       .uio_out(uio_out),
       .uio_oe (uio_oe),
       .ena    (ena),
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: (c) 2026 Matthew Emerson
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Pytest front end that runs every cocotb test in its own simulator process.
+
+The tests in test_sha3_256.py each reset the DUT and share no state, so they
+can be spread across cores with pytest-xdist:
+
+    pytest -n auto test_runner.py
+
+Each xdist worker compiles the RTL once into its own build directory and
+then runs its share of the testcases there. Set SIM to pick the simulator
+(default: icarus).
+"""
+
+import ast
+import os
+from pathlib import Path
+
+import pytest
+from cocotb_tools.runner import get_runner
+
+
+TEST_DIR = Path(__file__).resolve().parent
+SRC_DIR = TEST_DIR.parent / "src"
+PROJECT_SOURCES = [
+    "tt_um_emersonmde_vilya.v", "sha3_controller.v", "keccak_round.v", "keccak_rc.v",
+]
+TEST_MODULE = "test_sha3_256"
+SIM = os.getenv("SIM", "icarus")
+# The Makefile flow gets this timescale from cocotb; without it Verilator
+# stops on TIMESCALEMOD warnings
+TIMESCALE = ("1ns", "1ps")
+# Per-simulator build options, matching the Makefile. tb.v generates its clock
+# with delays, so Verilator needs --timing.
+BUILD_ARGS = {
+    "verilator": ["--timing", "-O3", "--x-assign", "fast", "--x-initial", "fast"],
+}
+
+
+def _cocotb_testcases(module):
+    """Names of the async test_* functions defined in a cocotb test module."""
+    tree = ast.parse((TEST_DIR / f"{module}.py").read_text())
+    return [
+        node.name for node in tree.body
+        if isinstance(node, ast.AsyncFunctionDef) and node.name.startswith("test_")
+    ]
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Compile the RTL once per worker and return the runner that built it."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    build_dir = TEST_DIR / "sim_build" / "parallel" / worker
+
+    sim = get_runner(SIM)
+    sim.build(
+        sources=[SRC_DIR / f for f in PROJECT_SOURCES] + [TEST_DIR / "tb.v"],
+        includes=[SRC_DIR],
+        hdl_toplevel="tb",
+        timescale=TIMESCALE,
+        build_args=BUILD_ARGS.get(SIM, []),
+        build_dir=build_dir,
+    )
+    return sim
+
+
+@pytest.mark.parametrize("testcase", _cocotb_testcases(TEST_MODULE))
+def test_sha3_256(runner, testcase):
+    # Separate test_dir per testcase so concurrent runs don't share tb.fst
+    runner.test(
+        test_module=TEST_MODULE,
+        hdl_toplevel="tb",
+        testcase=testcase,
+        test_dir=Path(runner.build_dir) / testcase,
+    )
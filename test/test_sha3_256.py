@@ -16,91 +16,171 @@ Tests the full hash pipeline through the TT wrapper pin interface:
   - uio_out[6]  = absorb_ready
 """
 
+import hashlib
+import logging
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles, RisingEdge
+from cocotb.triggers import (
+    ClockCycles, ReadWrite, RisingEdge, SimTimeoutError, ValueChange,
+    with_timeout,
+)
 
-from sha3_reference import sha3_256, sha3_256_pad
+from sha3_reference import sha3_256_pad
 from keccak_reference import keccak_f1600, state_to_bytes
 
 
+# Known-answer digests: SHA-3-256("") and SHA-3-256("abc")
+EMPTY_HASH = bytes.fromhex(
+    "a7ffc6f8bf1ed76651c14756a061d662"
+    "f580ff4de43b49fa82d80a4b80f8434a"
+)
+ABC_HASH = bytes.fromhex(
+    "3a985da74fe225b2045c172d6bd390bd"
+    "855f086e3e9d525b46bfe24511431532"
+)
+
+# Padded blocks for the messages the edge-case tests feed by hand
+PAD_EMPTY = sha3_256_pad(b"")
+PAD_ABC = sha3_256_pad(b"abc")
+
+# Expected digests for the generated test messages, computed once at import
+# so no test waits on the reference while the simulator sits idle.
+EXPECTED = {
+    msg: hashlib.sha3_256(msg).digest()
+    for msg in (b"a" * 200, b"b" * 135, b"first", b"second")
+}
+
+# First 32 bytes of Keccak-f[1600] applied to the all-zeros state
+KECCAK_ZERO_BYTES = state_to_bytes(keccak_f1600([0] * 25))[:32]
+
+# uio_in control bits
+START = 0x01
+DATA_VALID = 0x02
+LAST_BLOCK = 0x04
+RESULT_NEXT = 0x08
+
+# uio_out status bits
+BUSY = 0x10
+RESULT_READY = 0x20
+ABSORB_READY = 0x40
+
+# uio_oe: bits 7:4 drive status out, bits 3:0 take control in
+UIO_OE = 0xF0
+
+# Period of the clock generated in tb.v
+CLK_PERIOD_NS = 30
+
+# Rising edge of dut.clk, bound once by the first reset_dut() so helpers don't
+# rebuild the trigger on every cycle. The clock free-runs in tb.v for the whole
+# simulation, so one trigger serves every test.
+CLK = None
+
+
 # ---------------------------------------------------------------------------
 # Helper functions for driving the TT pin interface
+#
+# Every helper (and every test between helper calls) leaves ui_in and uio_in
+# idle at 0, so helpers don't re-drive the idle value on entry.
 # ---------------------------------------------------------------------------
 
 async def reset_dut(dut):
     """Apply reset and initialize all inputs."""
+    global CLK
+    if CLK is None:
+        CLK = RisingEdge(dut.clk)
+
     dut.ena.value = 1
     dut.ui_in.value = 0
     dut.uio_in.value = 0
     dut.rst_n.value = 0
-    await ClockCycles(dut.clk, 10)
+    await ClockCycles(dut.clk, 3)  # reset is synchronous; 3 edges is plenty
     dut.rst_n.value = 1
-    await ClockCycles(dut.clk, 2)
+    await CLK
 
 
 async def start_hash(dut):
     """Pulse the start signal for one clock cycle."""
-    dut.uio_in.value = 0x01  # start = bit 0
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = START
+    await CLK
     dut.uio_in.value = 0x00
-    await ClockCycles(dut.clk, 1)
+    await CLK
+
+
+async def feed_bytes(dut, data, uio_val):
+    """Drive data onto ui_in one byte per cycle, holding uio_in at uio_val.
+
+    The bytes are handed to the testbench feeder in a single write; tb.v then
+    drives the pins, so Python wakes once per burst instead of once per byte.
+    The pins fall back to the (idle) ui_in/uio_in once the burst is done.
+    """
+    assert len(data) <= 136, f"Feeder holds at most 136 bytes, got {len(data)}"
+
+    dut.feed_data.value = int.from_bytes(data, "little")
+    dut.feed_uio.value = uio_val
+    dut.feed_count.value = len(data)
+    await ClockCycles(dut.clk, len(data))
 
 
 async def absorb_block(dut, block, is_last=False):
     """Feed a 136-byte block into the absorber, one byte per cycle."""
     assert len(block) == 136, f"Block must be 136 bytes, got {len(block)}"
 
-    for i, byte_val in enumerate(block):
-        dut.ui_in.value = byte_val
-        uio_val = 0x02  # data_valid = bit 1
-        if is_last:
-            uio_val |= 0x04  # last_block = bit 2
-        dut.uio_in.value = uio_val
-        await ClockCycles(dut.clk, 1)
-
-    # Deassert data_valid
-    dut.uio_in.value = 0x00
-    dut.ui_in.value = 0
+    uio_val = DATA_VALID | LAST_BLOCK if is_last else DATA_VALID
+    await feed_bytes(dut, block, uio_val)
 
 
 def get_status(dut):
     """Read status signals from uio_out. Returns (busy, result_ready, absorb_ready)."""
     val = int(dut.uio_out.value)
-    return (val >> 4) & 1, (val >> 5) & 1, (val >> 6) & 1
+    return (int((val & BUSY) != 0), int((val & RESULT_READY) != 0),
+            int((val & ABSORB_READY) != 0))
 
 
 async def wait_permutation(dut, timeout=100):
-    """Wait for the Keccak permutation to complete."""
-    for _ in range(timeout):
-        await ClockCycles(dut.clk, 1)
-        busy, _, _ = get_status(dut)
-        if not busy:
-            return
-    raise TimeoutError("Permutation did not complete within timeout")
+    """Wait for the Keccak permutation to complete.
+
+    Sleeps on changes of uio_out rather than polling busy every cycle, so
+    Python only wakes when a status bit actually moves. Returns at once if
+    busy is already low, since uio_out may then never change again.
+    """
+    busy, _, _ = get_status(dut)
+    if not busy:
+        return
+
+    status_change = ValueChange(dut.uio_out)
+
+    async def busy_cleared():
+        while True:
+            await status_change
+            busy, _, _ = get_status(dut)
+            if not busy:
+                return
+
+    try:
+        await with_timeout(busy_cleared(), timeout * CLK_PERIOD_NS, "ns")
+    except SimTimeoutError:
+        raise TimeoutError("Permutation did not complete within timeout") from None
 
 
 async def read_hash(dut, num_bytes=32):
-    """Read hash output bytes using result_next."""
-    result = []
+    """Read hash output bytes using result_next.
 
-    # First byte is available immediately when result_ready goes high
-    await ClockCycles(dut.clk, 1)
-    result.append(int(dut.uo_out.value) & 0xFF)
+    The testbench drain captures uo_out and pulses result_next on its own,
+    one byte every other cycle with result_next low in between, and the
+    digest is read back from it in a single access.
+    """
+    assert num_bytes <= 32, f"Digest is 32 bytes, asked for {num_bytes}"
 
-    # Read remaining bytes
-    for i in range(num_bytes - 1):
-        dut.uio_in.value = 0x08  # result_next = bit 3
-        await ClockCycles(dut.clk, 1)
-        dut.uio_in.value = 0x00
-        await ClockCycles(dut.clk, 1)
-        result.append(int(dut.uo_out.value) & 0xFF)
+    dut.drain_count.value = num_bytes
+    await ClockCycles(dut.clk, 2 * num_bytes - 1)
+    await ReadWrite()  # let the last capture land in drain_data
 
-    return bytes(result)
+    # Captured bytes sit in the top num_bytes of drain_data, first byte lowest
+    drained = dut.drain_data.value.to_unsigned() >> (8 * (32 - num_bytes))
+    return drained.to_bytes(num_bytes, "little")
 
 
 async def compute_hash(dut, message):
@@ -134,8 +214,6 @@ async def test_keccak_f1600_zeros(dut):
     """Verify Keccak-f[1600] on all-zeros state matches reference."""
     dut._log.info("test_keccak_f1600_zeros: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")  # ~33 MHz
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Start a hash, absorb 136 zero bytes (all zeros XOR state = no change),
@@ -153,11 +231,11 @@ async def test_keccak_f1600_zeros(dut):
     hw_output = await read_hash(dut)
 
     # Reference: Keccak-f[1600] on all-zeros, then read first 32 bytes
-    ref_state = keccak_f1600([0] * 25)
-    ref_bytes = state_to_bytes(ref_state)[:32]
+    ref_bytes = KECCAK_ZERO_BYTES
 
-    dut._log.info(f"HW output:  {hw_output.hex()}")
-    dut._log.info(f"Reference:  {ref_bytes.hex()}")
+    if dut._log.isEnabledFor(logging.DEBUG):
+        dut._log.debug("HW output:  %s", hw_output.hex())
+        dut._log.debug("Reference:  %s", ref_bytes.hex())
 
     assert hw_output == ref_bytes, \
         f"Mismatch!\n  HW:  {hw_output.hex()}\n  Ref: {ref_bytes.hex()}"
@@ -174,18 +252,14 @@ async def test_sha3_256_empty(dut):
     """SHA-3-256 of empty message must produce known hash."""
     dut._log.info("test_sha3_256_empty: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     hw_hash = await compute_hash(dut, b"")
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
 
-    dut._log.info(f"HW hash:    {hw_hash.hex()}")
-    dut._log.info(f"Expected:   {expected.hex()}")
+    if dut._log.isEnabledFor(logging.DEBUG):
+        dut._log.debug("HW hash:    %s", hw_hash.hex())
+        dut._log.debug("Expected:   %s", expected.hex())
 
     assert hw_hash == expected, \
         f"SHA-3-256('') mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
@@ -202,18 +276,14 @@ async def test_sha3_256_abc(dut):
     """SHA-3-256 of 'abc' must produce known hash."""
     dut._log.info("test_sha3_256_abc: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     hw_hash = await compute_hash(dut, b"abc")
-    expected = bytes.fromhex(
-        "3a985da74fe225b2045c172d6bd390bd"
-        "855f086e3e9d525b46bfe24511431532"
-    )
+    expected = ABC_HASH
 
-    dut._log.info(f"HW hash:    {hw_hash.hex()}")
-    dut._log.info(f"Expected:   {expected.hex()}")
+    if dut._log.isEnabledFor(logging.DEBUG):
+        dut._log.debug("HW hash:    %s", hw_hash.hex())
+        dut._log.debug("Expected:   %s", expected.hex())
 
     assert hw_hash == expected, \
         f"SHA-3-256('abc') mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
@@ -230,16 +300,15 @@ async def test_sha3_256_multiblock(dut):
     """SHA-3-256 of a 200-byte message (requires 2 blocks)."""
     dut._log.info("test_sha3_256_multiblock: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = b"a" * 200
     hw_hash = await compute_hash(dut, msg)
-    expected = sha3_256(msg)
+    expected = EXPECTED[msg]
 
-    dut._log.info(f"HW hash:    {hw_hash.hex()}")
-    dut._log.info(f"Expected:   {expected.hex()}")
+    if dut._log.isEnabledFor(logging.DEBUG):
+        dut._log.debug("HW hash:    %s", hw_hash.hex())
+        dut._log.debug("Expected:   %s", expected.hex())
 
     assert hw_hash == expected, \
         f"SHA-3-256('a'*200) mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
@@ -256,16 +325,15 @@ async def test_sha3_256_135bytes(dut):
     """135-byte message: padding byte is 0x86 (0x06 | 0x80), single byte."""
     dut._log.info("test_sha3_256_135bytes: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = b"b" * 135
     hw_hash = await compute_hash(dut, msg)
-    expected = sha3_256(msg)
+    expected = EXPECTED[msg]
 
-    dut._log.info(f"HW hash:    {hw_hash.hex()}")
-    dut._log.info(f"Expected:   {expected.hex()}")
+    if dut._log.isEnabledFor(logging.DEBUG):
+        dut._log.debug("HW hash:    %s", hw_hash.hex())
+        dut._log.debug("Expected:   %s", expected.hex())
 
     assert hw_hash == expected, \
         f"SHA-3-256('b'*135) mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
@@ -282,23 +350,21 @@ async def test_sha3_256_back_to_back(dut):
     """Compute two hashes in sequence to verify proper reset between hashes."""
     dut._log.info("test_sha3_256_back_to_back: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # First hash
     hw_hash1 = await compute_hash(dut, b"first")
-    expected1 = sha3_256(b"first")
+    expected1 = EXPECTED[b"first"]
     assert hw_hash1 == expected1, \
         f"First hash mismatch!\n  HW:  {hw_hash1.hex()}\n  Exp: {expected1.hex()}"
-    dut._log.info("First hash correct")
+    dut._log.debug("First hash correct")
 
     # Second hash
     hw_hash2 = await compute_hash(dut, b"second")
-    expected2 = sha3_256(b"second")
+    expected2 = EXPECTED[b"second"]
     assert hw_hash2 == expected2, \
         f"Second hash mismatch!\n  HW:  {hw_hash2.hex()}\n  Exp: {expected2.hex()}"
-    dut._log.info("Second hash correct")
+    dut._log.debug("Second hash correct")
 
     dut._log.info("test_sha3_256_back_to_back: PASSED")
 
@@ -312,11 +378,9 @@ async def test_uio_oe(dut):
     """Verify uio_oe is correctly set: bits 7:4 outputs, bits 3:0 inputs."""
     dut._log.info("test_uio_oe: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
-    expected_oe = 0b11110000
+    expected_oe = UIO_OE
     actual_oe = int(dut.uio_oe.value)
 
     assert actual_oe == expected_oe, \
@@ -341,23 +405,21 @@ async def test_start_during_permute(dut):
     """
     dut._log.info("test_start_during_permute: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Start hash and absorb the padded empty-message block
-    blocks = sha3_256_pad(b"")
+    blocks = PAD_EMPTY
     await start_hash(dut)
     await absorb_block(dut, blocks[0], is_last=True)
 
     # We're now in PERMUTE. Verify busy is asserted.
-    await ClockCycles(dut.clk, 1)
+    await CLK
     busy, _, _ = get_status(dut)
     assert busy == 1, "Expected busy=1 during permutation"
 
     # Pulse start mid-permute (should be ignored)
-    dut.uio_in.value = 0x01  # start
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = START
+    await CLK
     dut.uio_in.value = 0x00
 
     # Wait for permutation to finish
@@ -368,10 +430,7 @@ async def test_start_during_permute(dut):
     assert result_ready == 1, "Expected result_ready after permutation"
 
     hw_hash = await read_hash(dut)
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
     assert hw_hash == expected, \
         f"Hash corrupted by start during permute!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -387,12 +446,10 @@ async def test_start_during_squeeze(dut):
     """Pulsing start while reading hash output must restart for a new hash."""
     dut._log.info("test_start_during_squeeze: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Complete a hash of "abc"
-    blocks = sha3_256_pad(b"abc")
+    blocks = PAD_ABC
     await start_hash(dut)
     await absorb_block(dut, blocks[0], is_last=True)
     await wait_permutation(dut)
@@ -400,20 +457,17 @@ async def test_start_during_squeeze(dut):
     # Read only 4 bytes (partial read)
     _, result_ready, _ = get_status(dut)
     assert result_ready == 1, "Expected result_ready"
-    await ClockCycles(dut.clk, 1)
+    await CLK
     _ = int(dut.uo_out.value)  # byte 0
     for _ in range(3):
-        dut.uio_in.value = 0x08
-        await ClockCycles(dut.clk, 1)
+        dut.uio_in.value = RESULT_NEXT
+        await CLK
         dut.uio_in.value = 0x00
-        await ClockCycles(dut.clk, 1)
+        await CLK
 
     # Now start a new hash of "" while still in SQUEEZE
     hw_hash = await compute_hash(dut, b"")
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
     assert hw_hash == expected, \
         f"Hash after squeeze restart mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -429,18 +483,11 @@ async def test_start_during_absorb(dut):
     """Pulsing start mid-absorb must discard partial data and restart."""
     dut._log.info("test_start_during_absorb: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Start a hash, send 50 bytes of garbage
     await start_hash(dut)
-    for i in range(50):
-        dut.ui_in.value = 0xFF
-        dut.uio_in.value = 0x02  # data_valid
-        await ClockCycles(dut.clk, 1)
-    dut.uio_in.value = 0x00
-    dut.ui_in.value = 0
+    await feed_bytes(dut, b"\xff" * 50, DATA_VALID)
 
     # Verify we're still in ABSORB
     _, _, absorb_ready = get_status(dut)
@@ -448,10 +495,7 @@ async def test_start_during_absorb(dut):
 
     # Now restart with start and do a proper hash of ""
     hw_hash = await compute_hash(dut, b"")
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
     assert hw_hash == expected, \
         f"Hash after absorb restart mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -467,23 +511,18 @@ async def test_data_valid_during_idle(dut):
     """data_valid while in IDLE must not corrupt state for subsequent hash."""
     dut._log.info("test_data_valid_during_idle: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Assert data_valid with non-zero data while in IDLE
     dut.ui_in.value = 0xAB
-    dut.uio_in.value = 0x02  # data_valid
+    dut.uio_in.value = DATA_VALID
     await ClockCycles(dut.clk, 5)
     dut.uio_in.value = 0x00
     dut.ui_in.value = 0
 
     # Now do a normal hash — should not be affected
     hw_hash = await compute_hash(dut, b"abc")
-    expected = bytes.fromhex(
-        "3a985da74fe225b2045c172d6bd390bd"
-        "855f086e3e9d525b46bfe24511431532"
-    )
+    expected = ABC_HASH
     assert hw_hash == expected, \
         f"Hash corrupted by data_valid in IDLE!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -499,29 +538,19 @@ async def test_data_valid_during_permute(dut):
     """data_valid while permuting must not corrupt the state."""
     dut._log.info("test_data_valid_during_permute: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
-    blocks = sha3_256_pad(b"abc")
+    blocks = PAD_ABC
     await start_hash(dut)
     await absorb_block(dut, blocks[0], is_last=True)
 
     # Spam data_valid with garbage during permutation
-    for _ in range(10):
-        dut.ui_in.value = 0xFF
-        dut.uio_in.value = 0x02  # data_valid
-        await ClockCycles(dut.clk, 1)
-    dut.uio_in.value = 0x00
-    dut.ui_in.value = 0
+    await feed_bytes(dut, b"\xff" * 10, DATA_VALID)
 
     await wait_permutation(dut)
 
     hw_hash = await read_hash(dut)
-    expected = bytes.fromhex(
-        "3a985da74fe225b2045c172d6bd390bd"
-        "855f086e3e9d525b46bfe24511431532"
-    )
+    expected = ABC_HASH
     assert hw_hash == expected, \
         f"Hash corrupted by data_valid during permute!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -537,41 +566,27 @@ async def test_result_next_during_absorb(dut):
     """result_next while absorbing must not affect the hash computation."""
     dut._log.info("test_result_next_during_absorb: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
-    blocks = sha3_256_pad(b"abc")
+    blocks = PAD_ABC
     await start_hash(dut)
 
     # Send first 50 bytes normally
-    for i in range(50):
-        dut.ui_in.value = blocks[0][i]
-        dut.uio_in.value = 0x02  # data_valid
-        await ClockCycles(dut.clk, 1)
+    await feed_bytes(dut, blocks[0][:50], DATA_VALID)
 
     # Pulse result_next mid-absorb (should be ignored)
-    dut.uio_in.value = 0x08  # result_next
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = RESULT_NEXT
+    await CLK
     dut.uio_in.value = 0x00
-    await ClockCycles(dut.clk, 1)
+    await CLK
 
     # Send remaining 86 bytes
-    for i in range(50, 136):
-        dut.ui_in.value = blocks[0][i]
-        uio_val = 0x02 | 0x04  # data_valid + last_block
-        dut.uio_in.value = uio_val
-        await ClockCycles(dut.clk, 1)
-    dut.uio_in.value = 0x00
-    dut.ui_in.value = 0
+    await feed_bytes(dut, blocks[0][50:], DATA_VALID | LAST_BLOCK)
 
     await wait_permutation(dut)
 
     hw_hash = await read_hash(dut)
-    expected = bytes.fromhex(
-        "3a985da74fe225b2045c172d6bd390bd"
-        "855f086e3e9d525b46bfe24511431532"
-    )
+    expected = ABC_HASH
     assert hw_hash == expected, \
         f"Hash corrupted by result_next during absorb!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -587,16 +602,14 @@ async def test_reset_during_permute(dut):
     """Asserting reset mid-permutation must cleanly reset; next hash must work."""
     dut._log.info("test_reset_during_permute: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
-    blocks = sha3_256_pad(b"abc")
+    blocks = PAD_ABC
     await start_hash(dut)
     await absorb_block(dut, blocks[0], is_last=True)
 
     # Verify we're permuting
-    await ClockCycles(dut.clk, 1)
+    await CLK
     busy, _, _ = get_status(dut)
     assert busy == 1, "Expected busy during permutation"
 
@@ -615,10 +628,7 @@ async def test_reset_during_permute(dut):
 
     # Do a fresh hash — must work correctly
     hw_hash = await compute_hash(dut, b"abc")
-    expected = bytes.fromhex(
-        "3a985da74fe225b2045c172d6bd390bd"
-        "855f086e3e9d525b46bfe24511431532"
-    )
+    expected = ABC_HASH
     assert hw_hash == expected, \
         f"Hash after reset-during-permute mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -634,12 +644,10 @@ async def test_reset_during_squeeze(dut):
     """Asserting reset while reading hash must cleanly reset; next hash must work."""
     dut._log.info("test_reset_during_squeeze: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Complete a hash
-    blocks = sha3_256_pad(b"abc")
+    blocks = PAD_ABC
     await start_hash(dut)
     await absorb_block(dut, blocks[0], is_last=True)
     await wait_permutation(dut)
@@ -647,10 +655,10 @@ async def test_reset_during_squeeze(dut):
     # Read a few bytes
     _, result_ready, _ = get_status(dut)
     assert result_ready == 1, "Expected result_ready"
-    await ClockCycles(dut.clk, 1)
+    await CLK
     _ = int(dut.uo_out.value)
-    dut.uio_in.value = 0x08
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = RESULT_NEXT
+    await CLK
     dut.uio_in.value = 0x00
 
     # Reset mid-squeeze
@@ -666,10 +674,7 @@ async def test_reset_during_squeeze(dut):
 
     # Fresh hash must work
     hw_hash = await compute_hash(dut, b"")
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
     assert hw_hash == expected, \
         f"Hash after reset-during-squeeze mismatch!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -685,37 +690,29 @@ async def test_simultaneous_start_data_valid(dut):
     """When start and data_valid are both asserted in ABSORB, start must win."""
     dut._log.info("test_simultaneous_start_data_valid: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # Start a hash, send some garbage bytes
     await start_hash(dut)
-    for i in range(20):
-        dut.ui_in.value = 0xDE
-        dut.uio_in.value = 0x02  # data_valid
-        await ClockCycles(dut.clk, 1)
+    await feed_bytes(dut, b"\xde" * 20, DATA_VALID)
 
     # Assert start + data_valid simultaneously (start should take priority)
     dut.ui_in.value = 0xAD
-    dut.uio_in.value = 0x03  # start(0x01) | data_valid(0x02)
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = START | DATA_VALID
+    await CLK
     dut.uio_in.value = 0x00
     dut.ui_in.value = 0
-    await ClockCycles(dut.clk, 1)
+    await CLK
 
     # State should now be cleared. A fresh hash of "" should be correct.
     # (compute_hash calls start_hash internally, which will re-clear)
     # Instead, manually feed the padded empty block to verify state was cleared.
-    blocks = sha3_256_pad(b"")
+    blocks = PAD_EMPTY
     await absorb_block(dut, blocks[0], is_last=True)
     await wait_permutation(dut)
     hw_hash = await read_hash(dut)
 
-    expected = bytes.fromhex(
-        "a7ffc6f8bf1ed76651c14756a061d662"
-        "f580ff4de43b49fa82d80a4b80f8434a"
-    )
+    expected = EMPTY_HASH
     assert hw_hash == expected, \
         f"State not cleared when start+data_valid simultaneous!\n  HW:  {hw_hash.hex()}\n  Exp: {expected.hex()}"
 
@@ -731,8 +728,6 @@ async def test_status_signal_timing(dut):
     """Verify busy/result_ready/absorb_ready transition at the correct times."""
     dut._log.info("test_status_signal_timing: start")
 
-    clock = Clock(dut.clk, 30, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # IDLE: all status low
@@ -741,20 +736,20 @@ async def test_status_signal_timing(dut):
         f"IDLE status wrong: busy={busy} rr={result_ready} ar={absorb_ready}"
 
     # Start -> ABSORB: absorb_ready should go high
-    dut.uio_in.value = 0x01
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = START
+    await CLK
     dut.uio_in.value = 0x00
-    await ClockCycles(dut.clk, 1)
+    await CLK
     busy, result_ready, absorb_ready = get_status(dut)
     assert (busy, result_ready, absorb_ready) == (0, 0, 1), \
         f"ABSORB status wrong: busy={busy} rr={result_ready} ar={absorb_ready}"
 
     # Absorb a full block to trigger PERMUTE
-    blocks = sha3_256_pad(b"")
+    blocks = PAD_EMPTY
     await absorb_block(dut, blocks[0], is_last=True)
 
     # Should now be in PERMUTE: busy high
-    await ClockCycles(dut.clk, 1)
+    await CLK
     busy, result_ready, absorb_ready = get_status(dut)
     assert (busy, result_ready, absorb_ready) == (1, 0, 0), \
         f"PERMUTE status wrong: busy={busy} rr={result_ready} ar={absorb_ready}"
@@ -775,10 +770,10 @@ async def test_status_signal_timing(dut):
         f"Post-read SQUEEZE status wrong: busy={busy} rr={result_ready} ar={absorb_ready}"
 
     # One more result_next pulse transitions to IDLE
-    dut.uio_in.value = 0x08  # result_next
-    await ClockCycles(dut.clk, 1)
+    dut.uio_in.value = RESULT_NEXT
+    await CLK
     dut.uio_in.value = 0x00
-    await ClockCycles(dut.clk, 1)
+    await CLK
     busy, result_ready, absorb_ready = get_status(dut)
     assert (busy, result_ready, absorb_ready) == (0, 0, 0), \
         f"Post-SQUEEZE IDLE status wrong: busy={busy} rr={result_ready} ar={absorb_ready}"
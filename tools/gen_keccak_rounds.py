@@ -0,0 +1,172 @@
+"""
+Generate keccak_rounds.py: Keccak-f[1600] rounds as straight-line Python.
+
+Each of the 24 rounds becomes its own function with theta, rho, pi, chi and
+iota written out lane by lane, with the rotation offsets, Pi destinations and
+round constant folded in. keccak_reference.keccak_f1600 runs these instead of
+the generic keccak_round loop.
+
+The rounds use lane complementing (Keccak Code Package, "bebigokimisa"): the
+lanes in COMPLEMENTED are kept bitwise inverted between rounds. Complement
+commutes with theta's XORs, rho and pi, so only chi changes. With the inverted
+inputs most chi terms become a plain AND or OR, leaving 8 NOTs per round
+instead of 25. Callers complement those lanes on entry and exit.
+
+Regenerate after changing the tables in keccak_tables.py:
+
+    python tools/gen_keccak_rounds.py tools/keccak_rounds.py
+
+The output path defaults to keccak_rounds.py next to this script. The file is
+written to a temporary name and renamed into place, so an interrupted run never
+leaves a half-written module. The generator reads only keccak_tables.py, so
+it works even if the current keccak_rounds.py is missing or broken.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(__file__))
+
+from keccak_tables import RC, ROT_FLAT, PI_DST
+
+
+MASK = "0xFFFFFFFFFFFFFFFF"
+
+# Lanes stored complemented between rounds: A[1,0], A[2,0], A[3,1], A[2,2],
+# A[2,3], A[0,4]
+COMPLEMENTED = (1, 2, 8, 12, 17, 20)
+
+
+def _rotl(expr, n):
+    """Source for a 64-bit left rotate of the local named expr by n."""
+    if n == 0:
+        return expr
+    return f"((({expr} << {n}) | ({expr} >> {64 - n})) & {MASK})"
+
+
+def gen_round(r):
+    """Source lines for the function computing round r."""
+    lines = [f"def _round_{r}(s):"]
+    rows = [", ".join(f"a{i}" for i in range(y, y + 5)) for y in range(0, 25, 5)]
+    lines.append("    (" + ",\n     ".join(rows) + ") = s")
+
+    # Theta
+    for x in range(5):
+        lines.append(f"    c{x} = " + " ^ ".join(f"a{5*y + x}" for y in range(5)))
+    for x in range(5):
+        lines.append(f"    d{x} = c{(x - 1) % 5} ^ {_rotl(f'c{(x + 1) % 5}', 1)}")
+
+    # Theta + Rho + Pi: b[PI_DST[i]] = rotl(a[i] ^ d[x], ROT_FLAT[i])
+    for i in range(25):
+        lines.append(f"    t = a{i} ^ d{i % 5}")
+        lines.append(f"    b{PI_DST[i]} = {_rotl('t', ROT_FLAT[i])}")
+
+    # Chi + Iota
+    b_inv = _pi_inversion()
+    lines.append("    return [")
+    for y in range(0, 25, 5):
+        for x in range(5):
+            i, j, k = y + x, y + (x + 1) % 5, y + (x + 2) % 5
+            lane = _chi_lane(i, j, k, b_inv, i in COMPLEMENTED)
+            if i == 0:
+                lane += f" ^ 0x{RC[r]:016X}"
+            lines.append(f"        {lane},")
+    lines.append("    ]")
+    return lines
+
+
+def _pi_inversion():
+    """Which b lanes come out of theta/rho/pi complemented.
+
+    XOR and rotation pass complements straight through, so each flag is
+    just the parity of the complemented lanes that were XORed together.
+    """
+    a_inv = [i in COMPLEMENTED for i in range(25)]
+    c_inv = [sum(a_inv[5*y + x] for y in range(5)) % 2 == 1 for x in range(5)]
+    d_inv = [c_inv[(x - 1) % 5] != c_inv[(x + 1) % 5] for x in range(5)]
+    b_inv = [False] * 25
+    for i in range(25):
+        b_inv[PI_DST[i]] = a_inv[i] != d_inv[i % 5]
+    return b_inv
+
+
+def _chi_lane(i, j, k, b_inv, want_inv):
+    """Source for chi output lane i = b[i] ^ (~b[j] & b[k]) on stored lanes.
+
+    b_inv says which stored b lanes are complemented; the result must be
+    complemented iff want_inv. Returns the form that needs the fewest NOTs.
+    In Python a NOT is ^ MASK, except inside an AND with a non-negative
+    operand where ~ is safe.
+    """
+    bi, bj, bk = f"b{i}", f"b{j}", f"b{k}"
+    # (term, term_inverted, nots): ~b[j] & b[k] written on the stored lanes,
+    # either as the true value or as its complement
+    if b_inv[j] and not b_inv[k]:
+        forms = [(f"({bj} & {bk})", False, 0)]
+    elif not b_inv[j] and b_inv[k]:
+        forms = [(f"({bj} | {bk})", True, 0)]
+    elif not b_inv[j]:
+        forms = [(f"(~{bj} & {bk})", False, 1),
+                 (f"({bj} | ({bk} ^ {MASK}))", True, 1)]
+    else:
+        forms = [(f"({bj} & ~{bk})", False, 1),
+                 (f"(({bj} ^ {MASK}) | {bk})", True, 1)]
+
+    best = None
+    for term, term_inv, nots in forms:
+        fix = (b_inv[i] != term_inv) != want_inv
+        cost = nots + fix
+        if best is None or cost < best[0]:
+            best = (cost, f"{bi} ^ {term}" + (f" ^ {MASK}" if fix else ""))
+    return best[1]
+
+
+def gen_module():
+    """Source of the whole generated module."""
+    out = [
+        '"""',
+        "Keccak-f[1600] rounds unrolled into straight-line Python.",
+        "",
+        "Generated by gen_keccak_rounds.py -- do not edit by hand. Regenerate with:",
+        "",
+        "    python tools/gen_keccak_rounds.py tools/keccak_rounds.py",
+        "",
+        "ROUNDS[r] computes keccak_reference.keccak_round(state, r) on a state",
+        "whose COMPLEMENTED lanes are stored bitwise inverted, and returns the",
+        "result in the same form.",
+        '"""',
+        "",
+        "COMPLEMENTED = " + repr(COMPLEMENTED),
+    ]
+    for r in range(24):
+        out += ["", ""] + gen_round(r)
+    out += ["", ""]
+    out.append("ROUNDS = (")
+    for r in range(24):
+        out.append(f"    _round_{r},")
+    out.append(")")
+    return "\n".join(out) + "\n"
+
+
+def write_module(path):
+    """Write the generated module to path via a temporary file and rename."""
+    source = gen_module()
+    fd, tmp_path = tempfile.mkstemp(
+        suffix=".py.tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(source)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        out_path = sys.argv[1]
+    else:
+        here = os.path.dirname(os.path.abspath(__file__))
+        out_path = os.path.join(here, "keccak_rounds.py")
+    write_module(out_path)
+    print(f"Wrote {out_path}")
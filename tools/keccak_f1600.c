@@ -0,0 +1,68 @@
+/*
+ * Copyright (c) 2026 Matthew Emerson
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Keccak-f[1600] permutation in C, loaded by keccak_reference.py via ctypes
+ *
+ * Build (from the repo root):
+ *   cc -O3 -march=native -shared -fPIC -o tools/keccak_f1600.so tools/keccak_f1600.c
+ *
+ * State layout matches keccak_reference.py: 25 uint64 lanes, A[5*y + x].
+ * The Python wrapper passes the 200-byte FIPS 202 state directly, so this
+ * assumes a little-endian host.
+ */
+
+#include <stdint.h>
+
+static const uint64_t RC[24] = {
+    0x0000000000000001ULL, 0x0000000000008082ULL, 0x800000000000808AULL,
+    0x8000000080008000ULL, 0x000000000000808BULL, 0x0000000080000001ULL,
+    0x8000000080008081ULL, 0x8000000000008009ULL, 0x000000000000008AULL,
+    0x0000000000000088ULL, 0x0000000080008009ULL, 0x000000008000000AULL,
+    0x000000008000808BULL, 0x800000000000008BULL, 0x8000000000008089ULL,
+    0x8000000000008003ULL, 0x8000000000008002ULL, 0x8000000000000080ULL,
+    0x000000000000800AULL, 0x800000008000000AULL, 0x8000000080008081ULL,
+    0x8000000000008080ULL, 0x0000000080000001ULL, 0x8000000080008008ULL,
+};
+
+// Rotation offsets in lane order, ROT[5*y + x] = r[x][y]
+static const unsigned ROT[25] = {
+     0,  1, 62, 28, 27,
+    36, 44,  6, 55, 20,
+     3, 10, 43, 25, 39,
+    41, 45, 15, 21,  8,
+    18,  2, 61, 56, 14,
+};
+
+// Masking the right shift keeps n = 0 defined; GCC/Clang emit a single rol
+static inline uint64_t rotl64(uint64_t v, unsigned n)
+{
+    return (v << n) | (v >> ((64 - n) & 63));
+}
+
+void keccak_f1600(uint64_t s[25])
+{
+    uint64_t C[5], D[5], B[25];
+
+    for (int r = 0; r < 24; r++) {
+        // Theta
+        for (int x = 0; x < 5; x++)
+            C[x] = s[x] ^ s[5 + x] ^ s[10 + x] ^ s[15 + x] ^ s[20 + x];
+        for (int x = 0; x < 5; x++)
+            D[x] = C[(x + 4) % 5] ^ rotl64(C[(x + 1) % 5], 1);
+
+        // Rho and Pi: A'[y, (2x+3y) mod 5] = rotl(A[x, y])
+        for (int y = 0; y < 5; y++)
+            for (int x = 0; x < 5; x++)
+                B[5 * ((2 * x + 3 * y) % 5) + y] =
+                    rotl64(s[5 * y + x] ^ D[x], ROT[5 * y + x]);
+
+        // Chi
+        for (int y = 0; y < 25; y += 5)
+            for (int x = 0; x < 5; x++)
+                s[y + x] = B[y + x] ^ (~B[y + (x + 1) % 5] & B[y + (x + 2) % 5]);
+
+        // Iota
+        s[0] ^= RC[r];
+    }
+}
@@ -4,36 +4,37 @@ Keccak-f[1600] reference implementation in Python.
 Produces per-round intermediate states for verification against RTL.
 State is represented as a flat list of 25 64-bit lanes, indexed as A[5*y + x].
 Byte order within lanes is little-endian (FIPS 202 Section 3.1.2).
+
+keccak_f1600_c() runs the permutation through the optional C build in
+keccak_f1600.c (see that file for the build command) and falls back to this
+module's Python implementation when the library is not present.
 """
 
-# Round constants (from FIPS 202 / keccak.team)
-RC = [
-    0x0000000000000001, 0x0000000000008082, 0x800000000000808A,
-    0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
-    0x8000000080008081, 0x8000000000008009, 0x000000000000008A,
-    0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
-    0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
-    0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
-    0x000000000000800A, 0x800000008000000A, 0x8000000080008081,
-    0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
-]
-
-# Rotation offsets r[x][y]
-ROT_OFFSETS = [
-    # y=0  y=1  y=2  y=3  y=4
-    [  0,  36,   3,  41,  18],  # x=0
-    [  1,  44,  10,  45,   2],  # x=1
-    [ 62,   6,  43,  15,  61],  # x=2
-    [ 28,  55,  25,  21,  56],  # x=3
-    [ 27,  20,  39,   8,  14],  # x=4
-]
+import ctypes
+import os
+import struct
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keccak_tables import RC, ROT_OFFSETS
+from keccak_tables import ROT_FLAT as _ROT_FLAT, PI_DST as _PI_DST
 
 MASK64 = (1 << 64) - 1
 
+# Precomputed index tables so the round loops do no % 5 arithmetic
+_PREV = (4, 0, 1, 2, 3)  # (x - 1) % 5
+_NEXT = (1, 2, 3, 4, 0)  # (x + 1) % 5
+# (lane, rotation, Pi destination, column) for the fused Theta/Rho/Pi pass
+_LANE_STEPS = tuple((i, _ROT_FLAT[i], _PI_DST[i], i % 5) for i in range(25))
+
 
 def rotl64(val, n):
-    """Left rotate a 64-bit value by n positions."""
-    n = n % 64
+    """Left rotate a 64-bit value by n positions (0 <= n < 64).
+
+    Not called by the permutation itself: keccak_round and the generated
+    rounds inline this expression. Kept as public API and as the written-out
+    form of that inlined rotate.
+    """
     return ((val << n) | (val >> (64 - n))) & MASK64
 
 
@@ -48,41 +49,34 @@ def keccak_round(state, round_num):
         New list of 25 uint64 lanes after one round.
     """
     # Theta
-    C = [0] * 5
-    for x in range(5):
-        C[x] = state[x] ^ state[5+x] ^ state[10+x] ^ state[15+x] ^ state[20+x]
-
-    D = [0] * 5
-    for x in range(5):
-        D[x] = C[(x - 1) % 5] ^ rotl64(C[(x + 1) % 5], 1)
-
-    theta_out = [0] * 25
-    for y in range(5):
-        for x in range(5):
-            theta_out[5*y + x] = (state[5*y + x] ^ D[x]) & MASK64
-
-    # Rho
-    rho_out = [0] * 25
-    for y in range(5):
-        for x in range(5):
-            rho_out[5*y + x] = rotl64(theta_out[5*y + x], ROT_OFFSETS[x][y])
-
-    # Pi: A'[y, (2x+3y) mod 5] = A[x, y]
-    pi_out = [0] * 25
-    for y in range(5):
-        for x in range(5):
-            new_x = y
-            new_y = (2 * x + 3 * y) % 5
-            pi_out[5 * new_y + new_x] = rho_out[5*y + x]
-
-    # Chi
-    chi_out = [0] * 25
-    for y in range(5):
-        for x in range(5):
-            chi_out[5*y + x] = (
-                pi_out[5*y + x]
-                ^ ((~pi_out[5*y + (x+1) % 5] & MASK64) & pi_out[5*y + (x+2) % 5])
-            ) & MASK64
+    C0 = state[0] ^ state[5] ^ state[10] ^ state[15] ^ state[20]
+    C1 = state[1] ^ state[6] ^ state[11] ^ state[16] ^ state[21]
+    C2 = state[2] ^ state[7] ^ state[12] ^ state[17] ^ state[22]
+    C3 = state[3] ^ state[8] ^ state[13] ^ state[18] ^ state[23]
+    C4 = state[4] ^ state[9] ^ state[14] ^ state[19] ^ state[24]
+    # rotl64 is inlined in this function; all offsets are already 0..63
+    D = (
+        C4 ^ (((C1 << 1) | (C1 >> 63)) & MASK64),
+        C0 ^ (((C2 << 1) | (C2 >> 63)) & MASK64),
+        C1 ^ (((C3 << 1) | (C3 >> 63)) & MASK64),
+        C2 ^ (((C4 << 1) | (C4 >> 63)) & MASK64),
+        C3 ^ (((C0 << 1) | (C0 >> 63)) & MASK64),
+    )
+
+    # Theta + Rho + Pi in one pass: XOR in D[x], rotate, and store each lane
+    # straight at its Pi destination A'[y, (2x+3y) mod 5]
+    B = [0] * 25
+    for i, n, dst, x in _LANE_STEPS:
+        lane = state[i] ^ D[x]
+        B[dst] = ((lane << n) | (lane >> (64 - n))) & MASK64
+
+    # Chi, one row at a time. ~a & b needs no mask: b is non-negative and
+    # already fits in 64 bits.
+    chi_out = []
+    for y in range(0, 25, 5):
+        a0, a1, a2, a3, a4 = B[y:y+5]
+        chi_out += (a0 ^ (~a1 & a2), a1 ^ (~a2 & a3), a2 ^ (~a3 & a4),
+                    a3 ^ (~a4 & a0), a4 ^ (~a0 & a1))
 
     # Iota
     chi_out[0] ^= RC[round_num]
@@ -90,6 +84,26 @@ def keccak_round(state, round_num):
     return chi_out
 
 
+try:
+    from keccak_rounds import COMPLEMENTED, ROUNDS
+except ModuleNotFoundError as e:
+    # keccak_rounds.py is generated by gen_keccak_rounds.py. Only a missing
+    # file falls back to the generic round; a broken one is an error.
+    if e.name != "keccak_rounds":
+        raise
+    COMPLEMENTED = ()  # generic rounds keep every lane in normal form
+    ROUNDS = tuple(lambda state, r=r: keccak_round(state, r) for r in range(24))
+
+# XOR masks converting between a normal state and the lane-complemented form
+# the ROUNDS functions work on (the conversion is its own inverse)
+_LANE_COMPLEMENT = tuple(MASK64 if i in COMPLEMENTED else 0 for i in range(25))
+
+
+def _complement_lanes(state):
+    """Toggle the lanes in COMPLEMENTED between normal and inverted form."""
+    return [lane ^ m for lane, m in zip(state, _LANE_COMPLEMENT)]
+
+
 def keccak_f1600(state, trace=False):
     """Apply full Keccak-f[1600] permutation (24 rounds).
 
@@ -102,30 +116,113 @@ def keccak_f1600(state, trace=False):
         If trace=True: list of 25 states (one after each round)
     """
     states = []
-    for r in range(24):
-        state = keccak_round(state, r)
+    state = _complement_lanes(state)
+    for keccak_round_r in ROUNDS:
+        state = keccak_round_r(state)
         if trace:
-            states.append(list(state))
-    return states if trace else state
+            states.append(_complement_lanes(state))
+    return states if trace else _complement_lanes(state)
+
+
+def keccak_f1600_batch(states):
+    """Apply Keccak-f[1600] to many independent states at once.
+
+    Lane i of every state is packed into one wide integer, 64 bits per state,
+    so each XOR/AND in a round works on all N states in a single operation.
+    Rotations use per-field masks to keep bits inside their own lane.
+
+    Args:
+        states: sequence of N states, each a list of 25 uint64 lanes
+
+    Returns:
+        List of N permuted states, in input order.
+    """
+    n = len(states)
+    if n == 0:
+        return []
+    width = 64 * n
+    ones = (1 << width) - 1
+    unit = ones // MASK64  # 1 in the low bit of every 64-bit field
+    # low_bits[k]: the low k bits of every field
+    low_bits = [unit * ((1 << k) - 1) for k in range(64)]
+
+    def rotl(val, k):
+        low = low_bits[k]
+        return ((val << k) & (ones ^ low)) | ((val >> (64 - k)) & low)
+
+    A = [
+        int.from_bytes(
+            b"".join(st[i].to_bytes(8, "little") for st in states), "little")
+        for i in range(25)
+    ]
+    for r in range(24):
+        # Theta
+        C = [A[x] ^ A[5+x] ^ A[10+x] ^ A[15+x] ^ A[20+x] for x in range(5)]
+        D = [C[_PREV[x]] ^ rotl(C[_NEXT[x]], 1) for x in range(5)]
+
+        # Rho and Pi
+        B = [0] * 25
+        for y in range(0, 25, 5):
+            for x in range(5):
+                B[_PI_DST[y + x]] = rotl(A[y + x] ^ D[x], _ROT_FLAT[y + x])
+
+        # Chi: every packed lane is non-negative, so ~a & b stays in range
+        A = []
+        for y in range(0, 25, 5):
+            a0, a1, a2, a3, a4 = B[y:y+5]
+            A += (a0 ^ (~a1 & a2), a1 ^ (~a2 & a3), a2 ^ (~a3 & a4),
+                  a3 ^ (~a4 & a0), a4 ^ (~a0 & a1))
+
+        # Iota
+        A[0] ^= RC[r] * unit
+
+    packed = [lane.to_bytes(8 * n, "little") for lane in A]
+    return [
+        [int.from_bytes(lane[8*k:8*k + 8], "little") for lane in packed]
+        for k in range(n)
+    ]
 
 
 def state_to_bytes(state):
     """Convert lane array to 200-byte array (FIPS 202 byte order)."""
-    result = bytearray(200)
-    for i in range(25):
-        for b in range(8):
-            result[i * 8 + b] = (state[i] >> (8 * b)) & 0xFF
-    return bytes(result)
+    return struct.pack("<25Q", *state)
 
 
 def bytes_to_state(data):
     """Convert 200-byte array to lane array."""
-    state = [0] * 25
-    padded = data + b'\x00' * (200 - len(data))
-    for i in range(25):
-        for b in range(8):
-            state[i] |= padded[i * 8 + b] << (8 * b)
-    return state
+    padded = bytes(data) + bytes(200 - len(data))
+    return list(struct.unpack("<25Q", padded))
+
+
+def _load_c_permutation():
+    """Return the C keccak_f1600 from keccak_f1600.so, or None if unavailable."""
+    if sys.byteorder != "little":
+        return None
+    here = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(here, "keccak_f1600.so")
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    lib.keccak_f1600.argtypes = [ctypes.c_char_p]
+    lib.keccak_f1600.restype = None
+    return lib.keccak_f1600
+
+
+_c_keccak_f1600 = _load_c_permutation()
+
+
+def keccak_f1600_c(data):
+    """Apply Keccak-f[1600] to a 200-byte state (FIPS 202 byte order).
+
+    Uses the compiled keccak_f1600.c when it has been built, otherwise the
+    pure-Python permutation. The Python path stays the RTL reference.
+    """
+    if _c_keccak_f1600 is None:
+        return state_to_bytes(keccak_f1600(bytes_to_state(bytes(data))))
+    buf = ctypes.create_string_buffer(bytes(data), 200)
+    _c_keccak_f1600(buf)
+    return buf.raw
 
 
 def state_to_hex(state):
@@ -155,3 +252,38 @@ if __name__ == "__main__":
     traced = keccak_f1600(zero_state, trace=True)
     for r in range(2):
         print(f"  After round {r}: A[0,0] = {traced[r][0]:016x}")
+
+    # C build, if present, must agree with the Python permutation
+    if _c_keccak_f1600 is not None:
+        seed = bytes(range(200))
+        expected = state_to_bytes(keccak_f1600(bytes_to_state(seed)))
+        assert keccak_f1600_c(seed) == expected, \
+            "C keccak_f1600 disagrees with the Python reference"
+        print("\nC permutation cross-check PASSED!")
+
+    # Generated rounds must match the generic keccak_round, round by round
+    state = list(range(25))
+    for r in range(24):
+        expected = keccak_round(state, r)
+        got = _complement_lanes(ROUNDS[r](_complement_lanes(state)))
+        assert got == expected, f"keccak_rounds.py round {r} mismatch"
+        state = expected
+    print("\nGenerated rounds test PASSED!")
+
+    # The checked-in keccak_rounds.py (including its COMPLEMENTED set) must be
+    # exactly what the current generator and tables produce
+    import gen_keccak_rounds
+    rounds_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "keccak_rounds.py")
+    with open(rounds_path) as f:
+        assert f.read() == gen_keccak_rounds.gen_module(), \
+            "keccak_rounds.py is stale; run tools/gen_keccak_rounds.py"
+    print("Generated rounds up to date!")
+
+    # Batched permutation must match the scalar one state by state
+    batch_in = [[(i * 0x9E3779B97F4A7C15 + k) & MASK64 for i in range(25)]
+                for k in range(4)]
+    expected = [keccak_f1600(st) for st in batch_in]
+    assert keccak_f1600_batch(batch_in) == expected, \
+        "keccak_f1600_batch disagrees with keccak_f1600"
+    print("\nBatch permutation test PASSED!")
@@ -0,0 +1,2321 @@
+"""
+Keccak-f[1600] rounds unrolled into straight-line Python.
+
+Generated by gen_keccak_rounds.py -- do not edit by hand. Regenerate with:
+
+    python tools/gen_keccak_rounds.py tools/keccak_rounds.py
+
+ROUNDS[r] computes keccak_reference.keccak_round(state, r) on a state
+whose COMPLEMENTED lanes are stored bitwise inverted, and returns the
+result in the same form.
+"""
+
+COMPLEMENTED = (1, 2, 8, 12, 17, 20)
+
+
+def _round_0(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000000000001,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_1(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000000008082,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_2(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x800000000000808A,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_3(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000080008000,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_4(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x000000000000808B,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_5(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000080000001,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_6(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000080008081,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_7(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000008009,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_8(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x000000000000008A,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_9(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000000000088,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_10(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000080008009,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_11(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x000000008000000A,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_12(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x000000008000808B,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_13(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x800000000000008B,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_14(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000008089,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_15(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000008003,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_16(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000008002,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_17(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000000080,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_18(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x000000000000800A,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_19(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x800000008000000A,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_20(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000080008081,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_21(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000000008080,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_22(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x0000000080000001,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+def _round_23(s):
+    (a0, a1, a2, a3, a4,
+     a5, a6, a7, a8, a9,
+     a10, a11, a12, a13, a14,
+     a15, a16, a17, a18, a19,
+     a20, a21, a22, a23, a24) = s
+    c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+    c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+    c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+    c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+    c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+    d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a0 ^ d0
+    b0 = t
+    t = a1 ^ d1
+    b10 = (((t << 1) | (t >> 63)) & 0xFFFFFFFFFFFFFFFF)
+    t = a2 ^ d2
+    b20 = (((t << 62) | (t >> 2)) & 0xFFFFFFFFFFFFFFFF)
+    t = a3 ^ d3
+    b5 = (((t << 28) | (t >> 36)) & 0xFFFFFFFFFFFFFFFF)
+    t = a4 ^ d4
+    b15 = (((t << 27) | (t >> 37)) & 0xFFFFFFFFFFFFFFFF)
+    t = a5 ^ d0
+    b16 = (((t << 36) | (t >> 28)) & 0xFFFFFFFFFFFFFFFF)
+    t = a6 ^ d1
+    b1 = (((t << 44) | (t >> 20)) & 0xFFFFFFFFFFFFFFFF)
+    t = a7 ^ d2
+    b11 = (((t << 6) | (t >> 58)) & 0xFFFFFFFFFFFFFFFF)
+    t = a8 ^ d3
+    b21 = (((t << 55) | (t >> 9)) & 0xFFFFFFFFFFFFFFFF)
+    t = a9 ^ d4
+    b6 = (((t << 20) | (t >> 44)) & 0xFFFFFFFFFFFFFFFF)
+    t = a10 ^ d0
+    b7 = (((t << 3) | (t >> 61)) & 0xFFFFFFFFFFFFFFFF)
+    t = a11 ^ d1
+    b17 = (((t << 10) | (t >> 54)) & 0xFFFFFFFFFFFFFFFF)
+    t = a12 ^ d2
+    b2 = (((t << 43) | (t >> 21)) & 0xFFFFFFFFFFFFFFFF)
+    t = a13 ^ d3
+    b12 = (((t << 25) | (t >> 39)) & 0xFFFFFFFFFFFFFFFF)
+    t = a14 ^ d4
+    b22 = (((t << 39) | (t >> 25)) & 0xFFFFFFFFFFFFFFFF)
+    t = a15 ^ d0
+    b23 = (((t << 41) | (t >> 23)) & 0xFFFFFFFFFFFFFFFF)
+    t = a16 ^ d1
+    b8 = (((t << 45) | (t >> 19)) & 0xFFFFFFFFFFFFFFFF)
+    t = a17 ^ d2
+    b18 = (((t << 15) | (t >> 49)) & 0xFFFFFFFFFFFFFFFF)
+    t = a18 ^ d3
+    b3 = (((t << 21) | (t >> 43)) & 0xFFFFFFFFFFFFFFFF)
+    t = a19 ^ d4
+    b13 = (((t << 8) | (t >> 56)) & 0xFFFFFFFFFFFFFFFF)
+    t = a20 ^ d0
+    b14 = (((t << 18) | (t >> 46)) & 0xFFFFFFFFFFFFFFFF)
+    t = a21 ^ d1
+    b24 = (((t << 2) | (t >> 62)) & 0xFFFFFFFFFFFFFFFF)
+    t = a22 ^ d2
+    b9 = (((t << 61) | (t >> 3)) & 0xFFFFFFFFFFFFFFFF)
+    t = a23 ^ d3
+    b19 = (((t << 56) | (t >> 8)) & 0xFFFFFFFFFFFFFFFF)
+    t = a24 ^ d4
+    b4 = (((t << 14) | (t >> 50)) & 0xFFFFFFFFFFFFFFFF)
+    return [
+        b0 ^ (b1 | b2) ^ 0x8000000080008008,
+        b1 ^ ((b2 ^ 0xFFFFFFFFFFFFFFFF) | b3),
+        b2 ^ (b3 & b4),
+        b3 ^ (b4 | b0),
+        b4 ^ (b0 & b1),
+        b5 ^ (b6 | b7),
+        b6 ^ (b7 & b8),
+        b7 ^ (b8 | (b9 ^ 0xFFFFFFFFFFFFFFFF)),
+        b8 ^ (b9 | b5),
+        b9 ^ (b5 & b6),
+        b10 ^ (b11 | b12),
+        b11 ^ (b12 & b13),
+        b12 ^ (~b13 & b14),
+        b13 ^ (b14 | b10) ^ 0xFFFFFFFFFFFFFFFF,
+        b14 ^ (b10 & b11),
+        b15 ^ (b16 & b17),
+        b16 ^ (b17 | b18),
+        b17 ^ ((b18 ^ 0xFFFFFFFFFFFFFFFF) | b19),
+        b18 ^ (b19 & b15) ^ 0xFFFFFFFFFFFFFFFF,
+        b19 ^ (b15 | b16),
+        b20 ^ (~b21 & b22),
+        b21 ^ (b22 | b23) ^ 0xFFFFFFFFFFFFFFFF,
+        b22 ^ (b23 & b24),
+        b23 ^ (b24 | b20),
+        b24 ^ (b20 & b21),
+    ]
+
+
+ROUNDS = (
+    _round_0,
+    _round_1,
+    _round_2,
+    _round_3,
+    _round_4,
+    _round_5,
+    _round_6,
+    _round_7,
+    _round_8,
+    _round_9,
+    _round_10,
+    _round_11,
+    _round_12,
+    _round_13,
+    _round_14,
+    _round_15,
+    _round_16,
+    _round_17,
+    _round_18,
+    _round_19,
+    _round_20,
+    _round_21,
+    _round_22,
+    _round_23,
+)
@@ -0,0 +1,35 @@
+"""
+Keccak-f[1600] constant tables.
+
+Shared by keccak_reference.py and gen_keccak_rounds.py. This module has no
+imports, so the generator can always load it, whatever state keccak_rounds.py
+is in.
+"""
+
+# Round constants (from FIPS 202 / keccak.team)
+RC = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A,
+    0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+    0x8000000080008081, 0x8000000000008009, 0x000000000000008A,
+    0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089,
+    0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+    0x000000000000800A, 0x800000008000000A, 0x8000000080008081,
+    0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+
+# Rotation offsets r[x][y]
+ROT_OFFSETS = [
+    # y=0  y=1  y=2  y=3  y=4
+    [  0,  36,   3,  41,  18],  # x=0
+    [  1,  44,  10,  45,   2],  # x=1
+    [ 62,   6,  43,  15,  61],  # x=2
+    [ 28,  55,  25,  21,  56],  # x=3
+    [ 27,  20,  39,   8,  14],  # x=4
+]
+
+# ROT_OFFSETS flattened into lane order: ROT_FLAT[5*y + x] = r[x][y]
+ROT_FLAT = tuple(ROT_OFFSETS[i % 5][i // 5] for i in range(25))
+
+# Pi destination of lane 5*y + x: A'[y, (2x+3y) mod 5] = A[x, y]
+PI_DST = tuple(5 * ((2 * x + 3 * y) % 5) + y for y in range(5) for x in range(5))
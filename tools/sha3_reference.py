@@ -3,15 +3,17 @@ SHA-3-256 reference implementation with padding helper.
 
 Uses keccak_reference.py for the permutation. Provides:
 - SHA-3 padding (pad10*1 with domain suffix 0x06)
-- Full SHA-3-256 hash computation
+- Full SHA-3-256 hash computation (hashlib, or the Python reference path)
 - Pre-padded block generation for hardware interface
 """
 
+import hashlib
+import struct
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from keccak_reference import keccak_f1600, bytes_to_state, state_to_bytes
+from keccak_reference import keccak_f1600, state_to_bytes
 
 
 RATE_BYTES = 136  # SHA-3-256 rate = 1088 bits = 136 bytes
@@ -20,38 +22,38 @@ RATE_BYTES = 136  # SHA-3-256 rate = 1088 bits = 136 bytes
 def sha3_256_pad(message):
     """Apply SHA-3 padding (pad10*1 with domain suffix 0x06).
 
-    Returns list of 136-byte blocks ready for absorption.
+    Returns list of 136-byte blocks (bytes) ready for absorption.
     """
+    # SHA-3 uses suffix 0x06, then pad10*1 up to a multiple of the rate
     msg = bytearray(message)
-
-    # Append domain suffix and padding
-    # SHA-3 uses suffix 0x06, then pad10*1
+    pad_len = -(len(msg) + 1) % RATE_BYTES
     msg.append(0x06)
-
-    # Pad to multiple of rate
-    while len(msg) % RATE_BYTES != 0:
-        msg.append(0x00)
+    msg += bytes(pad_len)
 
     # Set the last bit of the last byte of the last block
     msg[-1] |= 0x80
 
-    # Split into blocks
-    blocks = []
-    for i in range(0, len(msg), RATE_BYTES):
-        blocks.append(bytes(msg[i:i + RATE_BYTES]))
+    # Split into immutable blocks
+    msg = bytes(msg)
+    return [msg[i:i + RATE_BYTES] for i in range(0, len(msg), RATE_BYTES)]
 
-    return blocks
 
-
-def sha3_256(message):
+def sha3_256(message, *, use_reference=False):
     """Compute SHA-3-256 hash of a message.
 
     Args:
         message: bytes-like input
+        use_reference: if True, run the Python padding and permutation used
+            as the RTL oracle instead of hashlib's C implementation
 
     Returns:
         32-byte digest as bytes
     """
+    if not use_reference:
+        # bytes() so any input the reference path takes (e.g. a list of
+        # ints) is accepted here too
+        return hashlib.sha3_256(bytes(message)).digest()
+
     blocks = sha3_256_pad(message)
 
     # Initialize state
@@ -60,9 +62,9 @@ def sha3_256(message):
     # Absorb
     for block in blocks:
         # XOR block into state (rate portion only = first 136 bytes)
-        block_state = bytes_to_state(block + b'\x00' * 64)  # pad to 200 bytes
-        for i in range(17):  # 136 bytes = 17 lanes
-            state[i] ^= block_state[i]
+        block_lanes = struct.unpack_from("<17Q", block)  # 136 bytes = 17 lanes
+        for i in range(17):
+            state[i] ^= block_lanes[i]
         state = keccak_f1600(state)
 
     # Squeeze (output = first 32 bytes = 4 lanes)
@@ -87,7 +89,7 @@ if __name__ == "__main__":
     ]
 
     for msg, expected_hex in test_vectors:
-        digest = sha3_256(msg)
+        digest = sha3_256(msg, use_reference=True)
         digest_hex = digest.hex()
         status = "PASS" if digest_hex == expected_hex else "FAIL"
         print(f"[{status}] SHA-3-256({msg!r})")
@@ -102,21 +104,22 @@ if __name__ == "__main__":
 
     # Additional test: message > 136 bytes (multi-block)
     long_msg = b"a" * 200
-    digest = sha3_256(long_msg)
+    digest = sha3_256(long_msg, use_reference=True)
     print(f"SHA-3-256('a' * 200) = {digest.hex()}")
     blocks = format_padded_blocks(long_msg)
     for b in blocks:
         print(f"  {b}")
 
-    # Verify against hashlib
-    try:
-        import hashlib
-        for msg, expected_hex in test_vectors:
-            h = hashlib.sha3_256(msg).hexdigest()
-            assert h == expected_hex, f"hashlib mismatch for {msg!r}"
-
-        h = hashlib.sha3_256(long_msg).hexdigest()
-        assert h == digest.hex(), f"hashlib mismatch for long message"
-        print("\nAll hashlib cross-checks PASSED!")
-    except ImportError:
-        print("\nhashlib not available for cross-check")
+    # Verify the reference path against hashlib
+    for msg, expected_hex in test_vectors:
+        h = hashlib.sha3_256(msg).hexdigest()
+        assert h == expected_hex, f"hashlib mismatch for {msg!r}"
+
+    h = hashlib.sha3_256(long_msg).hexdigest()
+    assert h == digest.hex(), f"hashlib mismatch for long message"
+
+    # Default (hashlib) path must agree with the reference path
+    for msg in (b"", b"abc", long_msg, b"b" * 135, b"c" * 136, [0x61, 0x62]):
+        assert sha3_256(msg) == sha3_256(msg, use_reference=True), \
+            f"fast path mismatch for {msg[:8]!r}..."
+    print("\nAll hashlib cross-checks PASSED!")